@@ -1,4 +1,5 @@
 import contextlib
+import functools
 import inspect
 import os
 import typing as t
@@ -160,7 +161,10 @@ class AppTestRunner:
         """Whether to catch exceptions (other than `SystemExit`), default `True`."""
 
         print: bool
-        """Whether to print the command output for debugging, default `True`."""
+        """Whether to always print the command output for debugging, default `False`.
+
+        The output is printed anyway if the command has an unexpected exit code.
+        """
 
     def bind(self, *args: AppTestCliArg) -> t.Self:
         """Create new runner that prefixes the given args (partial application)."""
@@ -170,18 +174,16 @@ class AppTestRunner:
         self, *args: AppTestCliArg, raise_for_exit: bool = True, **opts: t.Unpack[Opts]
     ) -> "click.testing.Result":
         """Run an app command."""
-        import click.testing  # noqa: PLC0415  # import-outside-toplevel
-
         __tracebackhide__ = True
         expect_exit = opts.get("expect_exit", 0)
 
-        result = click.testing.CliRunner().invoke(
+        result = _click_cli_runner().invoke(
             self.app.click,
             [os.fspath(arg) for arg in (*self.args, *args)],
             catch_exceptions=opts.get("catch_exceptions", True),
         )
         ok = result.exit_code == expect_exit
-        if opts.get("print", True) or not ok:
+        if opts.get("print", False) or not ok:
             print(result.output)
         if not ok and raise_for_exit:  # pragma: no cover
             err = AssertionError("command failed with unexpected exit code")
@@ -207,6 +209,14 @@ class AppTestRunner:
         return value
 
 
+@functools.cache
+def _click_cli_runner() -> "click.testing.CliRunner":
+    """Shared `CliRunner`, which keeps no state between invocations."""
+    import click.testing  # noqa: PLC0415  # import-outside-toplevel
+
+    return click.testing.CliRunner()
+
+
 def _print_rich_command_help(ctx: click.Context) -> None:
     content = [*_HelpFormatter.default().full_command_help(ctx)]
     rich.print(markup.as_rich(content))
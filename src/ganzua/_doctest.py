@@ -60,6 +60,10 @@ class _SyntaxError(Exception):
         self.add_note(f"note: around here: {line}")
 
 
+_UNKNOWN_DIRECTIVE = re.compile(r"^\s*<!-- doctests?:")
+_VARIABLE = re.compile(r"[$]([A-Z_]++)(?=$|/)|[$][{]([A-Z_]++)[}]")
+_INLINE_CODE = re.compile(r"(?x)([`]++) ((?:[^`]++|(?!\1)[`])++) \1")
+
 _OutputType: t.TypeAlias = t.Literal["json", "toml"] | None
 
 
@@ -83,6 +87,19 @@ class Runner:
         self.executed_doctest_commands: int = 0
         self.ganzua = app.testrunner()
         self.example_dir = example_dir
+        self.variables = {
+            "EXAMPLE": str(example_dir),
+            "CORPUS": str(pathlib.Path("corpus").resolve()),
+        }
+        self._variable_names = {value: key for key, value in self.variables.items()}
+        self._variable_values = re.compile(
+            "("
+            + "|".join(
+                re.escape(value)
+                for value in sorted(self.variables.values(), reverse=True)
+            )
+            + ")"
+        )
         self.directives: t.Sequence[DoctestSyntax] = [
             DoctestExample(),  # register first so that contents aren't processed
             CommandOutputDirective(),
@@ -142,7 +159,7 @@ class Runner:
                 yield from directive.process(self, line.with_data(m))
                 return
 
-        if re.match(r"^\s*<!-- doctests?:", line):
+        if _UNKNOWN_DIRECTIVE.match(line):
             raise line.make_err("unknown directive")
 
         yield line
@@ -153,28 +170,11 @@ class Runner:
         yield "```"
 
     def _expand_variables(self, arg: str) -> str:
-        env = {
-            "EXAMPLE": str(self.example_dir),
-            "CORPUS": str(pathlib.Path("corpus").resolve()),
-        }
-        return re.sub(
-            r"[$]([A-Z_]++)(?=$|/)|[$][{]([A-Z_]++)[}]",
-            lambda m: env[m[1] or m[2]],
-            arg,
-        )
+        return _VARIABLE.sub(lambda m: self.variables[m[1] or m[2]], arg)
 
     def _unexpand_variables(self, data: str) -> str:
-        env = {
-            "EXAMPLE": str(self.example_dir),
-            "CORPUS": str(pathlib.Path("corpus").resolve()),
-        }
-        reverse = {value: key for key, value in env.items()}
-        return re.sub(
-            "("
-            + "|".join(re.escape(value) for value in sorted(env.values(), reverse=True))
-            + ")",
-            lambda m: "${" + reverse[m[1]] + "}",
-            data,
+        return self._variable_values.sub(
+            lambda m: "${" + self._variable_names[m[1]] + "}", data
         )
 
     def path_is_writeable(self, path: pathlib.Path | str) -> bool:
@@ -216,7 +216,7 @@ class Runner:
     def _command_output_ganzua(
         self, args: t.Sequence[str], *, line: _Line, raise_for_error: bool
     ) -> _OutputWithType:
-        result = self.ganzua(*args, print=False, raise_for_exit=False)
+        result = self.ganzua(*args, raise_for_exit=False)
         output = result.output.strip()
         if result.exit_code and raise_for_error:  # pragma: no cover
             err = line.make_err(f"command exited with status={result.exit_code}")
@@ -484,7 +484,7 @@ class _Input(_PeekableIter[_Line]):
         'inline `code`'
         """
         cell = cell.strip()
-        if m := re.fullmatch(r"(?x)([`]++) ((?:[^`]++|(?!\1)[`])++) \1", cell):
+        if m := _INLINE_CODE.fullmatch(cell):
             return m[2].strip()
         return cell
 
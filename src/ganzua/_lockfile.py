@@ -50,7 +50,7 @@ LockfileByName = t.NewType("LockfileByName", dict[str, list[LockedPackage]])
 def lockfile_from(path: PathLike) -> Lockfile:
     with error_context(f"while parsing {path}"):
         input_lockfile = _ANY_LOCKFILE_SCHEMA.validate_python(
-            tomllib.loads(path.read_text())
+            tomllib.loads(path.read_bytes().decode("utf-8"))
         )
 
         match input_lockfile:
@@ -240,7 +240,7 @@ def constraints_inspect(
     pyproject = _find_pyproject_toml(ctx, pyproject)
 
     with error_context(f"while parsing {pyproject}"):
-        doc = toml.RefRoot.parse(pyproject.read_text())
+        doc = toml.RefRoot.parse(pyproject.read_text(encoding="utf-8"))
     collector = ganzua.CollectRequirement([])
     ganzua.edit_pyproject(doc, FilteredEdit(collector, name=name))
     reqs = ganzua.Requirements(requirements=collector.reqs)
@@ -415,14 +415,14 @@ Where to load current versions from (for `--to=minimum`). Inferred if possible.
 def _toml_edit_scope(path: pathlib.Path) -> t.Iterator[toml.Ref]:
     """Load the TOML file and write it back afterwards."""
     with error_context(f"while parsing {path}"):
-        old_contents = path.read_text()
+        old_contents = path.read_text(encoding="utf-8")
         doc = toml.RefRoot.parse(old_contents)
 
     yield doc
 
     new_contents = doc.dumps()
     if new_contents != old_contents:
-        path.write_text(new_contents)
+        path.write_text(new_contents, encoding="utf-8")
 
 
 @app.command()
@@ -1,3 +1,4 @@
+import functools
 import pathlib
 import typing as t
 
@@ -41,14 +42,22 @@ def write_file(
 ) -> pathlib.Path:
     """Copy the `source` contents into the `dest` file.
 
+    The `source` contents are cached for the entire test session,
+    so `source` should be an immutable resource file.
+
     Returns the `dest` path.
     """
     dest = pathlib.Path(dest)
     match (source, data):
         case pathlib.Path(), None:
-            dest.write_bytes(source.read_bytes())
+            dest.write_bytes(_read_resource_bytes(source))
         case None, str():
             dest.write_text(data)
         case _:  # pragma: no cover
             raise AssertionError(f"unreachable: {source=} {data=}")
     return dest
+
+
+@functools.cache
+def _read_resource_bytes(source: pathlib.Path) -> bytes:
+    return source.read_bytes()
@@ -7,6 +7,8 @@ from ganzua._requirement import (
     parse_requirement_from_pep508,
 )
 
+from .helpers import parametrized
+
 
 def _assert_unconstrained_req(input: str, expected: str) -> None:
     __tracebackhide__ = True
@@ -16,9 +18,15 @@ def _assert_unconstrained_req(input: str, expected: str) -> None:
     assert req == parse_requirement_from_pep508(expected)
 
 
-def test_unconstrain_requirement() -> None:
-    _assert_unconstrained_req("foo", "foo")
-    _assert_unconstrained_req("foo >4,<=5,!=4.3.7", "foo")
+@parametrized(
+    "input",
+    {
+        "unconstrained": "foo",
+        "multiple-specifiers": "foo >4,<=5,!=4.3.7",
+    },
+)
+def test_unconstrain_requirement(input: str) -> None:
+    _assert_unconstrained_req(input, "foo")
 
 
 def test_unconstrain_requirement_poetry() -> None:
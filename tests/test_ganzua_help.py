@@ -1,4 +1,3 @@
-import dirty_equals
 import pytest
 from inline_snapshot import external_file, snapshot
 
@@ -24,6 +23,16 @@ _WELL_KNOWN_SUBCOMMANDS = (
 run = app.testrunner()
 
 
+@pytest.fixture(scope="module")
+def help_output() -> str:
+    return run.output("help")
+
+
+@pytest.fixture(scope="module")
+def all_help() -> str:
+    return run.output("help", "--all")
+
+
 def test_entrypoint() -> None:
     with pytest.raises(SystemExit) as errinfo:
         app(["help"])
@@ -35,32 +44,30 @@ def test_schema(command: str) -> None:
     """Can output a JSON schema for a given command."""
     # But we only test that the output is something json-ish
     schema = run.json("schema", command)
-    assert schema == dirty_equals.IsPartialDict()
+    assert isinstance(schema, dict)
+    assert schema
     assert schema == external_file(resources.DOCS / f"cli/schema.{command}.json")
 
 
-def test_help_mentions_subcommands() -> None:
-    output = run.output("help")
+def test_help_mentions_subcommands(help_output: str) -> None:
     for cmd in _WELL_KNOWN_COMMANDS:
-        assert f" {cmd} " in output
+        assert f" {cmd} " in help_output
 
 
-def test_help_shows_license() -> None:
-    assert "Apache-2.0 license" in run.output("help")
+def test_help_shows_license(help_output: str) -> None:
+    assert "Apache-2.0 license" in help_output
 
 
-def test_no_args_is_help() -> None:
+def test_no_args_is_help(help_output: str) -> None:
     # The no-args mode does nothing useful,
     # so the exit code should warn users that the tool didn't do anything useful.
     # But don't return an error code when the help was explicitly requested.
-    no_args = run.output(expect_exit=CLICK_ERROR)
-    explicit_help = run.output("help", expect_exit=0)
+    # (The `help_output` fixture already expects exit code 0.)
+    assert run.output(expect_exit=CLICK_ERROR) == help_output
 
-    assert no_args == explicit_help
 
-
-def test_help_explicit() -> None:
-    assert run.output("--help") == run.output("help")
+def test_help_explicit(help_output: str) -> None:
+    assert run.output("--help") == help_output
 
 
 def test_help_subcommand() -> None:
@@ -80,12 +87,14 @@ def test_help_rejects_unknown_commands(path: str) -> None:
     assert result.stderr.endswith(f"no such subcommand: {path}\n")
 
 
-def test_help_can_show_subcommands() -> None:
-    all_help = run.output("help", "--all")
-    assert all_help.startswith(run.output("help"))
-    for cmd in _WELL_KNOWN_SUBCOMMANDS:
-        assert f"\n\nganzua {cmd}\n-----" in all_help
-        assert run.output("help", "--all", *cmd.split()) in all_help
+def test_help_all_starts_with_help(all_help: str, help_output: str) -> None:
+    assert all_help.startswith(help_output)
+
+
+@pytest.mark.parametrize("cmd", _WELL_KNOWN_SUBCOMMANDS)
+def test_help_can_show_subcommands(cmd: str, all_help: str) -> None:
+    assert f"\n\nganzua {cmd}\n-----" in all_help
+    assert run.output("help", "--all", *cmd.split()) in all_help
 
 
 def test_help_can_use_markdown() -> None:
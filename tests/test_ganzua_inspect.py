@@ -1,6 +1,5 @@
 import contextlib
 import pathlib
-import secrets
 
 import pydantic
 import pytest
@@ -50,28 +49,32 @@ def test_can_load_empty_pylock(tmp_path: pathlib.Path) -> None:
 def test_does_not_care_about_filename(
     orig: pathlib.Path, tmp_path: pathlib.Path
 ) -> None:
-    # save the lockfile under a randomized name
-    randomized = write_file(tmp_path / secrets.token_hex(5), source=orig)
+    # save the lockfile under an unrelated name
+    renamed = write_file(tmp_path / "data", source=orig)
     for word in ("uv", "poetry", "lock", "toml"):
-        assert word not in randomized.name
+        assert word not in renamed.name
 
     # we get the same result, regardless of filename
-    assert inspect.json(randomized) == inspect.json(orig)
+    assert inspect.json(renamed) == inspect.json(orig)
 
 
-def test_can_locate_lockfile(tmp_path: pathlib.Path) -> None:
-    lockfile = resources.OLD_UV_LOCKFILE
-    output = inspect.json(lockfile)
+@pytest.fixture(scope="module")
+def old_uv_output() -> pydantic.JsonValue:
+    return inspect.json(resources.OLD_UV_LOCKFILE)
 
-    # can also use a directory
-    assert inspect.json(lockfile.parent) == output
 
-    # behavior when no explicit lockfile argument is passed
+def test_can_locate_lockfile_in_directory(old_uv_output: pydantic.JsonValue) -> None:
+    assert inspect.json(resources.OLD_UV_LOCKFILE.parent) == old_uv_output
+
+
+def test_can_locate_lockfile_in_cwd(
+    tmp_path: pathlib.Path, old_uv_output: pydantic.JsonValue
+) -> None:
     with contextlib.chdir(tmp_path):
         # fails in empty directory
         result = inspect(expect_exit=CLICK_ERROR)
         assert "Could not infer `LOCKFILE` for `.`." in result.stderr
 
         # but finds the lockfile if present
-        write_file(tmp_path / "uv.lock", source=lockfile)
-        assert inspect.json() == output
+        write_file(tmp_path / "uv.lock", source=resources.OLD_UV_LOCKFILE)
+        assert inspect.json() == old_uv_output